@@ -14,6 +14,9 @@ Usage:
 Default port: 31339
 """
 
+import functools
+import gzip
+import hashlib
 import http.server
 import json
 import os
@@ -21,10 +24,19 @@ import re
 import sqlite3
 import subprocess
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 from datetime import datetime
 
+# Optional: orjson serializes several times faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 DEFAULT_PORT = 31339
 
@@ -42,8 +54,23 @@ def parse_port(arg):
 
 PORT = parse_port(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT
 
-# Thread ID validation pattern
-THREAD_ID_PATTERN = re.compile(r'^thread-\d+-[a-f0-9]{8}$')
+# Server-sent events: change-check interval and idle keepalive (seconds)
+STREAM_POLL_INTERVAL = 0.5
+STREAM_KEEPALIVE = 15
+
+# Thread ID validation pattern (\A/\Z: unlike $, \Z won't accept a trailing newline)
+THREAD_ID_PATTERN = re.compile(r'\Athread-\d{1,20}-[a-f0-9]{8}\Z')
+
+# /api/thread/<id> and /api/thread/<id>/logs
+THREAD_ROUTE_PATTERN = re.compile(r'\A/api/thread/([^/]*)(/logs)?\Z')
+
+# JSON encoding for responses (bytes out, non-JSON types via str())
+if orjson:
+    def json_bytes(data):
+        return orjson.dumps(data, default=str)
+else:
+    def json_bytes(data):
+        return json.dumps(data, default=str).encode()
 
 # Find data directory
 def find_data_dir():
@@ -67,58 +94,194 @@ def find_data_dir():
 DATA_DIR = find_data_dir()
 DB_PATH = DATA_DIR / 'threads.db'
 
+# Dashboard queries. Kept as module constants so every call passes the
+# identical string and hits sqlite3's per-connection statement cache
+# (keyed by SQL text) instead of re-preparing
+SQL_STATUS = """
+    SELECT
+        (SELECT COUNT(*) FROM threads) AS total,
+        (SELECT COUNT(*) FROM threads WHERE status = 'running') AS running,
+        (SELECT COUNT(*) FROM threads WHERE status = 'ready') AS ready,
+        (SELECT COUNT(*) FROM events WHERE processed = 0) AS events_pending
+"""
+
+# Keyset pagination over (updated_at, id): updated_at has one-second
+# resolution, so id breaks ties. Cursor bounds are only added when given,
+# so the unpaged listing still includes rows with a NULL updated_at.
+# A `since` page is returned oldest first, so a client catching up can
+# continue from its last row without skipping anything
+SQL_THREADS = """
+    SELECT id, name, mode, status, phase, template, session_id, worktree,
+           context, created_at, updated_at
+    FROM threads {where}
+    ORDER BY updated_at {order}, id {order} LIMIT ?
+"""
+
+SQL_THREADS_BEFORE = "(updated_at, id) < (?, ?)"
+SQL_THREADS_SINCE = "(updated_at, id) > (?, ?)"
+
+SQL_THREAD_DETAIL = "SELECT * FROM threads WHERE id = ?"
+
+SQL_EVENTS = """
+    SELECT id, type, source, targets, data, processed, timestamp
+    FROM events
+    WHERE id < COALESCE(?, 9223372036854775807) AND id > COALESCE(?, 0)
+    ORDER BY id {order} LIMIT ?
+"""
+
+SQL_WORKTREES = """
+    SELECT w.id, w.thread_id, w.path, w.branch, w.base_branch, w.status,
+           t.name as thread_name, t.status as thread_status
+    FROM worktrees w
+    LEFT JOIN threads t ON w.thread_id = t.id
+    ORDER BY w.created_at DESC
+"""
+
+SQL_DATA_VERSION = "PRAGMA data_version"
+
+# Identifies this server process in ETags, since data_version values are
+# only meaningful for the connection that produced them
+BOOT_ID = f'{os.getpid():x}{time.time_ns():x}'
+
+# Shared read connection, opened on first use and kept for the process
+# lifetime so polls don't pay connect/schema-load on every query
+_db_conn = None
+_db_lock = threading.Lock()
+
+def open_db():
+    """Open the database read-only, falling back to read-write if unsupported"""
+    options = dict(check_same_thread=False, isolation_level=None)
+    try:
+        # The dashboard only reads; mode=ro skips write-lock bookkeeping and
+        # can never contend with the orchestrator as a writer
+        conn = sqlite3.connect(DB_PATH.resolve().as_uri() + '?mode=ro', uri=True, **options)
+        conn.execute("SELECT 1 FROM sqlite_master LIMIT 1")
+        return conn
+    except sqlite3.Error as e:
+        print(f"DB: read-only open failed ({e}), using read-write")
+        return sqlite3.connect(str(DB_PATH), **options)
+
 def get_db():
-    """Get database connection"""
-    if not DB_PATH.exists():
-        return None
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get shared database connection (caller must hold _db_lock)"""
+    global _db_conn
+    if _db_conn is None and DB_PATH.exists():
+        conn = open_db()
+        conn.execute("PRAGMA cache_size = -20000")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        _db_conn = conn
+    return _db_conn
+
+@contextmanager
+def db_connection():
+    """Hold the shared connection for the duration of a query"""
+    with _db_lock:
+        yield get_db()
+
+def query_db_raw(sql, params=()):
+    """Execute query and return (column names, row tuples)"""
+    with db_connection() as conn:
+        if not conn:
+            return [], []
+        try:
+            cursor = conn.execute(sql, params)
+            rows = cursor.fetchall()
+            return [col[0] for col in cursor.description], rows
+        except Exception as e:
+            print(f"DB error: {e}")
+            return [], []
 
 def query_db(sql, params=()):
     """Execute query and return results as list of dicts"""
-    conn = get_db()
-    if not conn:
-        return []
-    try:
-        cursor = conn.execute(sql, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
-    except Exception as e:
-        print(f"DB error: {e}")
-        return []
-    finally:
-        conn.close()
-
-def scalar_db(sql, params=()):
-    """Execute query and return single value"""
-    conn = get_db()
-    if not conn:
-        return 0
+    # Plain tuples zipped with the column names once: cheaper than building
+    # sqlite3.Row objects and converting each to a dict, and done outside
+    # the connection lock
+    columns, rows = query_db_raw(sql, params)
+    return [dict(zip(columns, row)) for row in rows]
+
+# Short-lived memo for the polled endpoints: every open tab asks for the
+# same counts every few seconds, so one query can serve them all
+CACHE_TTL = 1.0
+_cache = {}
+
+def ttl_cache(seconds=CACHE_TTL, tables=()):
+    """Cache an API method's result for `seconds`, tagged by source tables"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            key = (func.__name__,) + args
+            now = time.monotonic()
+            entry = _cache.get(key)
+            if entry and now - entry[0] < seconds:
+                return entry[1]
+            result = func(self, *args)
+            # Drop this method's expired entries so per-argument keys
+            # (e.g. one per observed stream state) don't accumulate
+            for old_key, old_entry in list(_cache.items()):
+                if old_key[0] == func.__name__ and now - old_entry[0] >= seconds:
+                    _cache.pop(old_key, None)
+            _cache[key] = (now, result, tables)
+            return result
+        return wrapper
+    return decorator
+
+def invalidate(table=None):
+    """Drop cached results that read from `table` (all results if None)"""
+    for key, entry in list(_cache.items()):
+        if table is None or table in entry[2]:
+            _cache.pop(key, None)
+
+def data_version():
+    """SQLite change counter; differs whenever another connection commits"""
+    with db_connection() as conn:
+        if not conn:
+            return None
+        try:
+            return conn.execute(SQL_DATA_VERSION).fetchone()[0]
+        except sqlite3.Error:
+            return None
+
+def file_signature(path):
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed"""
     try:
-        cursor = conn.execute(sql, params)
-        row = cursor.fetchone()
-        return row[0] if row else 0
-    except Exception as e:
-        print(f"DB error: {e}")
-        return 0
-    finally:
-        conn.close()
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+# Liveness dots don't need sub-second truth; coalesce PID file reads and
+# kill(0) probes across polls and stream clients
+PID_CHECK_TTL = 1.0
+_pid_cache = {}
 
 def is_pid_running(pid_file):
-    """Check if process from PID file is running"""
+    """Check if process from PID file is running (cached for PID_CHECK_TTL)"""
+    now = time.monotonic()
+    cached = _pid_cache.get(pid_file)
+    if cached and now - cached[0] < PID_CHECK_TTL:
+        return cached[1]
     try:
-        with open(pid_file) as f:
-            pid = int(f.read().strip())
+        pid = int(Path(pid_file).read_text().strip())
         os.kill(pid, 0)
-        return True
+        running = True
     except (FileNotFoundError, ValueError, ProcessLookupError, PermissionError, OSError):
-        return False
+        running = False
+    _pid_cache[pid_file] = (now, running)
+    return running
 
 def validate_thread_id(thread_id):
     """Validate thread ID format to prevent path traversal"""
     return bool(THREAD_ID_PATTERN.match(thread_id)) if thread_id else False
 
+def thread_cursor(query, name):
+    """Parse a two-part thread cursor: ?<name>=<updated_at>&<name>_id=<id>"""
+    updated_at = query.get(name, [None])[0]
+    thread_id = query.get(f'{name}_id', [None])[0]
+    if updated_at is None and thread_id is None:
+        return None
+    if updated_at is None or thread_id is None:
+        raise ValueError(f"'{name}' and '{name}_id' must be given together")
+    return (updated_at, thread_id)
+
 def sanitize_int(value, default=50, min_val=1, max_val=1000):
     """Safely parse integer with bounds"""
     try:
@@ -127,18 +290,61 @@ def sanitize_int(value, default=50, min_val=1, max_val=1000):
     except (ValueError, TypeError):
         return default
 
+LOG_READ_BLOCK = 8192
+# Most bytes read per requested line when tailing
+LOG_MAX_LINE_BYTES = 16384
+
+# Tails keyed by path, reused while the file's (mtime, size) is unchanged;
+# an idle thread's log then costs one stat() per poll
+LOG_CACHE_SIZE = 64
+_log_cache = {}
+# Handler threads share the cache; eviction must not race insertion
+_log_cache_lock = threading.Lock()
+
+def tail_file(path, lines):
+    """Return the last N lines of a file, reading backwards from EOF"""
+    # Read backwards in blocks until we have enough lines, so cost depends
+    # on the tail size rather than the file size. Blocks are joined once at
+    # the end, and the byte budget stops a few huge lines (e.g. stream-json
+    # output) from dragging in the whole file.
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        budget = lines * LOG_MAX_LINE_BYTES
+        blocks = []
+        newlines = 0
+        while pos > 0 and budget > 0 and newlines <= lines:
+            step = min(LOG_READ_BLOCK, pos, budget)
+            pos -= step
+            budget -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+    data = b''.join(reversed(blocks))
+    return b'\n'.join(data.splitlines()[-lines:]).decode('utf-8', 'replace')
+
 def read_log_file(path, lines=100):
     """Read last N lines of log file"""
+    # Limit lines to prevent memory exhaustion
+    lines = min(lines, 10000)
+    signature = file_signature(path)
+    with _log_cache_lock:
+        cached = _log_cache.get(path)
+    if signature is not None and cached and cached[:2] == (signature, lines):
+        return cached[2]
     try:
-        # Limit lines to prevent memory exhaustion
-        lines = min(lines, 10000)
-        with open(path, 'r') as f:
-            all_lines = f.readlines()
-            return ''.join(all_lines[-lines:])
+        content = tail_file(path, lines)
     except FileNotFoundError:
         return ''
     except (IOError, OSError) as e:
         return f'[Error reading log: {e}]'
+    if signature is not None:
+        with _log_cache_lock:
+            _log_cache.pop(path, None)
+            if len(_log_cache) >= LOG_CACHE_SIZE:
+                del _log_cache[next(iter(_log_cache))]
+            _log_cache[path] = (signature, lines, content)
+    return content
 
 # Dashboard HTML
 DASHBOARD_HTML = '''<!DOCTYPE html>
@@ -260,15 +466,17 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
         .log-viewer {
             background: #000;
             border-radius: 4px;
-            padding: 12px;
             font-size: 0.75rem;
-            max-height: 400px;
-            overflow-y: auto;
-            white-space: pre-wrap;
-            word-break: break-all;
-            line-height: 1.4;
+            height: 400px;
+            overflow: auto;
+            position: relative;
         }
-        .log-line { margin: 2px 0; }
+        /* Virtualized: the spacer gives the full scroll height, the window
+           holds only the visible lines. Fixed-height, unwrapped lines keep
+           the offset math exact. */
+        .log-spacer { position: relative; }
+        .log-window { position: absolute; top: 0; left: 0; min-width: 100%; padding: 0 12px; }
+        .log-line { height: 18px; line-height: 18px; white-space: pre; }
         .log-info { color: #4ade80; }
         .log-warn { color: #fbbf24; }
         .log-error { color: #f87171; }
@@ -332,8 +540,8 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
                     <span class="status-dot" id="api-status"></span>
                     <span>API Server</span>
                 </div>
-                <div class="refresh-indicator">
-                    Auto-refresh: <span id="refresh-countdown">3</span>s
+                <div class="refresh-indicator" title="Status and worktree data is cached server-side for up to 1s">
+                    Updates: <span id="stream-state">connecting</span> (data &le;1s old)
                 </div>
             </div>
         </header>
@@ -362,7 +570,7 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
                 <div class="card-header">
                     <span class="card-title">Threads</span>
                     <div class="card-actions">
-                        <button class="btn" onclick="refreshThreads()">⟳ Refresh</button>
+                        <button class="btn" onclick="refreshAll()">⟳ Refresh</button>
                     </div>
                 </div>
                 <div class="scrollable">
@@ -393,7 +601,7 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
                 <div class="card-header">
                     <span class="card-title">Worktrees</span>
                     <div class="card-actions">
-                        <button class="btn" onclick="refreshWorktrees()">⟳ Refresh</button>
+                        <button class="btn" onclick="refreshAll()">⟳ Refresh</button>
                     </div>
                 </div>
                 <div class="scrollable">
@@ -414,7 +622,7 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
                 <div class="card-header">
                     <span class="card-title">Recent Events</span>
                     <div class="card-actions">
-                        <button class="btn" onclick="refreshEvents()">⟳ Refresh</button>
+                        <button class="btn" onclick="refreshAll()">⟳ Refresh</button>
                     </div>
                 </div>
                 <div class="scrollable">
@@ -440,7 +648,11 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
                         <button class="btn" onclick="refreshLogs()">⟳ Refresh</button>
                     </div>
                 </div>
-                <div class="log-viewer" id="log-viewer">Loading logs...</div>
+                <div class="log-viewer" id="log-viewer">
+                    <div class="log-spacer" id="log-spacer">
+                        <div class="log-window" id="log-window">Loading logs...</div>
+                    </div>
+                </div>
             </div>
         </div>
     </div>
@@ -448,8 +660,6 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
     <script>
         let currentLogType = 'orchestrator';
         let selectedThreadId = null;
-        let refreshInterval = null;
-        let countdown = 3;
 
         async function fetchAPI(endpoint) {
             try {
@@ -481,79 +691,142 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
             } catch { return timestamp; }
         }
 
+        // Badge markup built once per status; unknown statuses are escaped
+        const BADGES = Object.fromEntries(
+            ['running', 'ready', 'waiting', 'completed', 'failed', 'created', 'sleeping', 'blocked', 'active']
+                .map(s => [s, `<span class="badge badge-${s}">${s}</span>`]));
+
         function statusBadge(status) {
             const s = status || 'created';
-            return `<span class="badge badge-${s}">${s}</span>`;
+            return BADGES[s] || `<span class="badge badge-${escapeHtml(s)}">${escapeHtml(s)}</span>`;
         }
 
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+
         function escapeHtml(str) {
             if (!str) return '';
-            const div = document.createElement('div');
-            div.textContent = str;
-            return div.innerHTML;
-        }
-
-        function colorizeLog(content) {
-            if (!content) return '<span style="color:var(--text-secondary)">No logs available</span>';
-            return content.split('\\n').map(line => {
-                let cls = '';
-                if (line.includes('INFO')) cls = 'log-info';
-                else if (line.includes('WARN')) cls = 'log-warn';
-                else if (line.includes('ERROR')) cls = 'log-error';
-                else if (line.includes('DEBUG') || line.includes('TRACE')) cls = 'log-debug';
-                return `<div class="log-line ${cls}">${escapeHtml(line)}</div>`;
-            }).join('');
-        }
-
-        async function refreshStatus() {
-            const data = await fetchAPI('/api/status');
-            if (!data) return;
-            document.getElementById('stat-total').textContent = data.threads?.total ?? '-';
-            document.getElementById('stat-running').textContent = data.threads?.running ?? '-';
-            document.getElementById('stat-ready').textContent = data.threads?.ready ?? '-';
-            document.getElementById('stat-events').textContent = data.events_pending ?? '-';
-            document.getElementById('orch-status').className = 'status-dot' + (data.orchestrator_running ? ' active' : '');
-            document.getElementById('api-status').className = 'status-dot' + (data.api_running ? ' active' : '');
-        }
-
-        async function refreshThreads() {
-            const data = await fetchAPI('/api/threads');
-            if (!data) return;
-            const tbody = document.getElementById('threads-table');
-            tbody.innerHTML = data.map(t => `
+            return String(str).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+        }
+
+        // One scan per line; the first level token found picks the class
+        const LOG_LEVEL = /INFO|WARN|ERROR|DEBUG|TRACE/;
+        const LOG_LEVEL_CLASS = {INFO: 'log-info', WARN: 'log-warn', ERROR: 'log-error', DEBUG: 'log-debug', TRACE: 'log-debug'};
+
+        function colorizeLine(line) {
+            const level = LOG_LEVEL.exec(line);
+            return `<div class="log-line ${level ? LOG_LEVEL_CLASS[level[0]] : ''}">${escapeHtml(line)}</div>`;
+        }
+
+        // Log viewer keeps at most LOG_MAX_LINES and renders only the lines
+        // in view (plus LOG_OVERSCAN either side)
+        const LOG_LINE_HEIGHT = 18;
+        const LOG_MAX_LINES = 2000;
+        const LOG_OVERSCAN = 10;
+        let logLines = [];
+        // Placeholder markup shown instead of lines (no thread, error, empty)
+        let logMessage = null;
+
+        function drawLog() {
+            const viewer = document.getElementById('log-viewer');
+            const spacer = document.getElementById('log-spacer');
+            const win = document.getElementById('log-window');
+            if (logMessage !== null) {
+                spacer.style.height = '0px';
+                win.style.transform = '';
+                win.innerHTML = logMessage;
+                return;
+            }
+            const height = logLines.length * LOG_LINE_HEIGHT + 'px';
+            if (spacer.style.height !== height) {
+                // Keep following the tail if the user was already at the bottom
+                const follow = viewer.scrollTop + viewer.clientHeight >= viewer.scrollHeight - LOG_LINE_HEIGHT;
+                spacer.style.height = height;
+                if (follow) viewer.scrollTop = viewer.scrollHeight;
+            }
+            const first = Math.max(0, Math.floor(viewer.scrollTop / LOG_LINE_HEIGHT) - LOG_OVERSCAN);
+            const last = Math.min(logLines.length, first + Math.ceil(viewer.clientHeight / LOG_LINE_HEIGHT) + 2 * LOG_OVERSCAN);
+            win.style.transform = `translateY(${first * LOG_LINE_HEIGHT}px)`;
+            win.innerHTML = logLines.slice(first, last).map(colorizeLine).join('');
+        }
+
+        function setLogLines(lines) {
+            logLines = lines.length > LOG_MAX_LINES ? lines.slice(-LOG_MAX_LINES) : lines;
+            logMessage = null;
+            schedule('log', drawLog);
+        }
+
+        function showLogMessage(html) {
+            logLines = [];
+            logMessage = html;
+            schedule('log', drawLog);
+        }
+
+        // DOM writes are queued by key (a newer write replaces an unflushed
+        // one) and applied together in one animation frame
+        const pendingWrites = new Map();
+        let frameRequested = false;
+
+        function schedule(key, write) {
+            pendingWrites.set(key, write);
+            if (frameRequested) return;
+            frameRequested = true;
+            requestAnimationFrame(() => {
+                frameRequested = false;
+                const writes = [...pendingWrites.values()];
+                pendingWrites.clear();
+                writes.forEach(w => w());
+            });
+        }
+
+        // Skip re-parsing a table whose markup hasn't changed
+        const renderedHtml = {};
+
+        function setHtml(id, html) {
+            if (renderedHtml[id] === html) return;
+            renderedHtml[id] = html;
+            schedule(id, () => { document.getElementById(id).innerHTML = html; });
+        }
+
+        function renderStatus(data) {
+            schedule('status', () => {
+                document.getElementById('stat-total').textContent = data.threads?.total ?? '-';
+                document.getElementById('stat-running').textContent = data.threads?.running ?? '-';
+                document.getElementById('stat-ready').textContent = data.threads?.ready ?? '-';
+                document.getElementById('stat-events').textContent = data.events_pending ?? '-';
+                document.getElementById('orch-status').className = 'status-dot' + (data.orchestrator_running ? ' active' : '');
+                document.getElementById('api-status').className = 'status-dot' + (data.api_running ? ' active' : '');
+            });
+        }
+
+        function renderThreads(data) {
+            setHtml('threads-table', data.map(t => `
                 <tr class="thread-row ${t.id === selectedThreadId ? 'selected' : ''}" onclick="selectThread('${t.id}')">
                     <td title="${t.id}">${escapeHtml(t.name || t.id.slice(0, 20))}</td>
                     <td>${t.mode || '-'}</td>
                     <td>${statusBadge(t.status)}</td>
-                    <td>${formatTimeAgo(t.updated_at)}</td>
+                    <td data-ts="${escapeHtml(t.updated_at || '')}">${formatTimeAgo(t.updated_at)}</td>
                 </tr>
-            `).join('') || '<tr><td colspan="4" style="color:var(--text-secondary)">No threads</td></tr>';
+            `).join('') || '<tr><td colspan="4" style="color:var(--text-secondary)">No threads</td></tr>');
         }
 
-        async function refreshWorktrees() {
-            const data = await fetchAPI('/api/worktrees');
-            if (!data) return;
-            const tbody = document.getElementById('worktrees-table');
-            tbody.innerHTML = data.map(w => `
+        function renderWorktrees(data) {
+            setHtml('worktrees-table', data.map(w => `
                 <tr>
                     <td>${escapeHtml(w.thread_name || w.thread_id?.slice(0, 12) || '-')}</td>
                     <td title="${w.path || ''}">${escapeHtml(w.branch || '-')}</td>
                     <td>${statusBadge(w.status || w.thread_status || 'active')}</td>
                 </tr>
-            `).join('') || '<tr><td colspan="3" style="color:var(--text-secondary)">No worktrees</td></tr>';
+            `).join('') || '<tr><td colspan="3" style="color:var(--text-secondary)">No worktrees</td></tr>');
         }
 
-        async function refreshEvents() {
-            const data = await fetchAPI('/api/events?limit=30');
-            if (!data) return;
-            const tbody = document.getElementById('events-table');
-            tbody.innerHTML = data.map(e => `
+        function renderEvents(data) {
+            setHtml('events-table', data.map(e => `
                 <tr>
                     <td class="event-type">${escapeHtml(e.type || '-')}</td>
                     <td class="event-source">${escapeHtml(e.source || '-')}</td>
                     <td>${formatTime(e.timestamp)}</td>
                 </tr>
-            `).join('') || '<tr><td colspan="3" style="color:var(--text-secondary)">No events</td></tr>';
+            `).join('') || '<tr><td colspan="3" style="color:var(--text-secondary)">No events</td></tr>');
         }
 
         async function selectThread(threadId) {
@@ -592,19 +865,21 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
         }
 
         async function refreshLogs() {
-            const viewer = document.getElementById('log-viewer');
             let data;
             if (currentLogType === 'orchestrator') {
                 data = await fetchAPI('/api/logs?lines=200');
             } else if (selectedThreadId) {
                 data = await fetchAPI('/api/thread/' + selectedThreadId + '/logs?lines=100');
             } else {
-                viewer.innerHTML = '<span style="color:var(--text-secondary)">Select a thread to view its logs</span>';
+                showLogMessage('<span style="color:var(--text-secondary)">Select a thread to view its logs</span>');
                 return;
             }
-            if (!data) { viewer.innerHTML = 'Failed to load logs'; return; }
-            viewer.innerHTML = colorizeLog(data.content);
-            viewer.scrollTop = viewer.scrollHeight;
+            if (!data) { showLogMessage('Failed to load logs'); return; }
+            if (!data.content) {
+                showLogMessage('<span style="color:var(--text-secondary)">No logs available</span>');
+                return;
+            }
+            setLogLines(data.content.split('\\n'));
         }
 
         function showLog(type) {
@@ -614,51 +889,98 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
             refreshLogs();
         }
 
+        function applySnapshot(data) {
+            if (data.status) renderStatus(data.status);
+            if (data.threads) renderThreads(data.threads);
+            if (data.worktrees) renderWorktrees(data.worktrees);
+            if (data.events) renderEvents(data.events);
+        }
+
         async function refreshAll() {
-            await Promise.all([refreshStatus(), refreshThreads(), refreshWorktrees(), refreshEvents()]);
-        }
-
-        function startAutoRefresh() {
-            countdown = 3;
-            document.getElementById('refresh-countdown').textContent = countdown;
-            if (refreshInterval) clearInterval(refreshInterval);
-            refreshInterval = setInterval(() => {
-                countdown--;
-                document.getElementById('refresh-countdown').textContent = countdown;
-                if (countdown <= 0) {
-                    countdown = 3;
-                    refreshAll();
-                    if (currentLogType === 'orchestrator') refreshLogs();
-                }
-            }, 1000);
-        }
-
-        refreshAll();
-        refreshLogs();
-        startAutoRefresh();
+            const data = await fetchAPI('/api/snapshot');
+            if (data) applySnapshot(data);
+        }
+
+        function startStream() {
+            // Server pushes only when the database or orchestrator log changes
+            const stream = new EventSource('/api/stream');
+            const state = document.getElementById('stream-state');
+            stream.onopen = () => { state.textContent = 'live'; };
+            stream.onerror = () => { state.textContent = 'reconnecting'; };
+            stream.addEventListener('snapshot', e => applySnapshot(JSON.parse(e.data)));
+            stream.addEventListener('logs', () => {
+                if (currentLogType === 'orchestrator') refreshLogs();
+            });
+        }
+
+        document.getElementById('log-viewer').addEventListener('scroll', () => schedule('log', drawLog));
+        // Updates are only pushed on change, so age the "Ns ago" cells
+        // locally, touching only the cells whose text moved
+        function ageCells() {
+            document.querySelectorAll('#threads-table [data-ts]').forEach(cell => {
+                const text = formatTimeAgo(cell.dataset.ts);
+                if (cell.textContent !== text) cell.textContent = text;
+            });
+        }
+        setInterval(() => schedule('age', ageCells), 1000);
+        startStream();
     </script>
 </body>
 </html>
 '''
 
+# The dashboard is static: encode, compress and fingerprint it once
+DASHBOARD_BYTES = DASHBOARD_HTML.encode()
+DASHBOARD_GZIP = gzip.compress(DASHBOARD_BYTES, 9)
+DASHBOARD_ETAG = 'W/"%s"' % hashlib.md5(DASHBOARD_BYTES).hexdigest()
+
 class DebugHandler(http.server.BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         pass  # Suppress logging
 
-    def send_json(self, data):
-        body = json.dumps(data, default=str).encode()
-        self.send_response(200)
+    def send_json(self, data, status=200, etag=None):
+        body = json_bytes(data)
+        self.send_response(status)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', len(body))
         self.send_header('Access-Control-Allow-Origin', '*')
+        if etag:
+            # Revalidate every time; unchanged data then costs a 304
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
         self.end_headers()
         self.wfile.write(body)
 
-    def send_html(self, content):
-        body = content.encode()
+    def send_json_if_changed(self, producer):
+        """Send producer()'s result, or 304 if the DB is unchanged since the client's copy"""
+        version = data_version()
+        if version is None:
+            self.send_json(producer())
+            return
+        etag = f'W/"{BOOT_ID}-{version}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_json(producer(), etag=etag)
+
+    def send_dashboard(self):
+        if self.headers.get('If-None-Match') == DASHBOARD_ETAG:
+            self.send_response(304)
+            self.send_header('ETag', DASHBOARD_ETAG)
+            self.end_headers()
+            return
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = DASHBOARD_GZIP if gzipped else DASHBOARD_BYTES
         self.send_response(200)
         self.send_header('Content-Type', 'text/html; charset=utf-8')
         self.send_header('Content-Length', len(body))
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'public, max-age=60')
+        self.send_header('ETag', DASHBOARD_ETAG)
         self.end_headers()
         self.wfile.write(body)
 
@@ -666,36 +988,47 @@ class DebugHandler(http.server.BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         path = parsed.path
         query = parse_qs(parsed.query)
+        thread_route = THREAD_ROUTE_PATTERN.match(path)
 
         if path == '/' or path == '/index.html':
-            self.send_html(DASHBOARD_HTML)
+            self.send_dashboard()
 
         elif path == '/api/status':
             self.send_json(self.api_status())
 
-        elif path == '/api/threads':
-            self.send_json(self.api_threads())
+        elif path == '/api/snapshot':
+            self.send_json(self.api_snapshot())
 
-        elif path.startswith('/api/thread/') and path.endswith('/logs'):
-            thread_id = path.replace('/api/thread/', '').replace('/logs', '')
-            # Security: validate thread ID to prevent path traversal
-            if not validate_thread_id(thread_id):
-                self.send_json({'error': 'Invalid thread ID'})
+        elif path == '/api/stream':
+            self.stream_updates()
+
+        elif path == '/api/threads':
+            limit = sanitize_int(query.get('limit', [100])[0], 100, 1, 500)
+            try:
+                before = thread_cursor(query, 'before')
+                since = thread_cursor(query, 'since')
+            except ValueError as e:
+                self.send_json({'error': str(e)}, 400)
                 return
-            lines = sanitize_int(query.get('lines', [50])[0], 50, 1, 1000)
-            self.send_json(self.api_thread_logs(thread_id, lines))
+            self.send_json_if_changed(lambda: self.api_threads(limit, before, since))
 
-        elif path.startswith('/api/thread/'):
-            thread_id = path.replace('/api/thread/', '')
-            # Security: validate thread ID to prevent path traversal
+        elif thread_route:
+            thread_id, logs = thread_route.groups()
+            # Security: validate thread ID before it reaches the DB or
+            # filesystem (prevents path traversal)
             if not validate_thread_id(thread_id):
-                self.send_json({'error': 'Invalid thread ID'})
-                return
-            self.send_json(self.api_thread_detail(thread_id))
+                self.send_json({'error': 'Invalid thread ID'}, 400)
+            elif logs:
+                lines = sanitize_int(query.get('lines', [50])[0], 50, 1, 1000)
+                self.send_json(self.api_thread_logs(thread_id, lines))
+            else:
+                self.send_json(self.api_thread_detail(thread_id))
 
         elif path == '/api/events':
             limit = sanitize_int(query.get('limit', [50])[0], 50, 1, 500)
-            self.send_json(self.api_events(limit))
+            before = sanitize_int(query.get('before', [None])[0], None, 1, 2**63 - 1)
+            since = sanitize_int(query.get('since', [None])[0], None, 0, 2**63 - 1)
+            self.send_json_if_changed(lambda: self.api_events(limit, before, since))
 
         elif path == '/api/worktrees':
             self.send_json(self.api_worktrees())
@@ -707,28 +1040,109 @@ class DebugHandler(http.server.BaseHTTPRequestHandler):
         else:
             self.send_error(404)
 
+    def stream_updates(self):
+        """Push snapshot/log change notifications until the client goes away"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        log_file = DATA_DIR / 'logs' / 'orchestrator.log'
+        # Sentinels, so the first poll always pushes both events (even when
+        # the log doesn't exist yet and file_signature() returns None)
+        last_state = last_log = object()
+        last_sent = time.monotonic()
+        try:
+            while True:
+                state = (
+                    data_version(),
+                    is_pid_running(DATA_DIR / 'orchestrator.pid'),
+                    is_pid_running(DATA_DIR / 'api-server.pid'),
+                )
+                log_sig = file_signature(log_file)
+                chunks = []
+                if state != last_state:
+                    last_state = state
+                    chunks.append(b"event: snapshot\ndata: " + json_bytes(self.stream_snapshot(state)) + b"\n\n")
+                if log_sig != last_log:
+                    last_log = log_sig
+                    chunks.append(b"event: logs\ndata: {}\n\n")
+                if not chunks and time.monotonic() - last_sent >= STREAM_KEEPALIVE:
+                    chunks.append(b": keepalive\n\n")
+                if chunks:
+                    self.wfile.write(b''.join(chunks))
+                    self.wfile.flush()
+                    last_sent = time.monotonic()
+                time.sleep(STREAM_POLL_INTERVAL)
+        except OSError:
+            # Client went away (closed tab, reset, timeout, ...)
+            pass
+
+    @ttl_cache(tables=('threads', 'events', 'worktrees'))
+    def api_snapshot(self):
+        """Everything the dashboard renders, in one response"""
+        return {
+            'status': self.api_status(),
+            'threads': self.api_threads(),
+            'worktrees': self.api_worktrees(),
+            'events': self.api_events(30),
+        }
+
+    @ttl_cache(tables=('threads', 'events', 'worktrees'))
+    def stream_snapshot(self, state):
+        """Snapshot for an observed (data_version, orchestrator, api) state"""
+        # Cached per state, so every stream client that sees the same change
+        # shares one build. Built from the uncached queries, and with the
+        # liveness flags taken from the state itself, so it can't predate
+        # the change it announces
+        _, orchestrator_running, api_running = state
+        status = self.api_status.__wrapped__(self)
+        status['orchestrator_running'] = orchestrator_running
+        status['api_running'] = api_running
+        return {
+            'status': status,
+            'threads': self.api_threads(),
+            'worktrees': self.api_worktrees.__wrapped__(self),
+            'events': self.api_events(30),
+        }
+
+    @ttl_cache(tables=('threads', 'events'))
     def api_status(self):
+        # All counts in one round-trip (this endpoint is polled the most)
+        rows = query_db(SQL_STATUS)
+        counts = rows[0] if rows else {}
         return {
             'threads': {
-                'total': scalar_db("SELECT COUNT(*) FROM threads"),
-                'running': scalar_db("SELECT COUNT(*) FROM threads WHERE status = 'running'"),
-                'ready': scalar_db("SELECT COUNT(*) FROM threads WHERE status = 'ready'"),
+                'total': counts.get('total', 0),
+                'running': counts.get('running', 0),
+                'ready': counts.get('ready', 0),
             },
-            'events_pending': scalar_db("SELECT COUNT(*) FROM events WHERE processed = 0"),
+            'events_pending': counts.get('events_pending', 0),
             'orchestrator_running': is_pid_running(DATA_DIR / 'orchestrator.pid'),
             'api_running': is_pid_running(DATA_DIR / 'api-server.pid'),
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }
 
-    def api_threads(self):
-        return query_db("""
-            SELECT id, name, mode, status, phase, template, session_id, worktree,
-                   context, created_at, updated_at
-            FROM threads ORDER BY updated_at DESC LIMIT 100
-        """)
+    def api_threads(self, limit=100, before=None, since=None):
+        """Threads by most recent update; `before`/`since` are (updated_at, id) cursors
+
+        With `since`, the page is the rows just after the cursor, oldest
+        first; pass its last row as the next `since` to keep catching up.
+        """
+        clauses, params = [], []
+        if before:
+            clauses.append(SQL_THREADS_BEFORE)
+            params.extend(before)
+        if since:
+            clauses.append(SQL_THREADS_SINCE)
+            params.extend(since)
+        where = 'WHERE ' + ' AND '.join(clauses) if clauses else ''
+        order = 'ASC' if since else 'DESC'
+        return query_db(SQL_THREADS.format(where=where, order=order), (*params, limit))
 
     def api_thread_detail(self, thread_id):
-        rows = query_db("SELECT * FROM threads WHERE id = ?", (thread_id,))
+        rows = query_db(SQL_THREAD_DETAIL, (thread_id,))
         return rows[0] if rows else {'error': 'Thread not found'}
 
     def api_thread_logs(self, thread_id, lines=50):
@@ -740,20 +1154,18 @@ class DebugHandler(http.server.BaseHTTPRequestHandler):
             'content': content
         }
 
-    def api_events(self, limit=50):
-        return query_db("""
-            SELECT id, type, source, target, data, processed, timestamp
-            FROM events ORDER BY timestamp DESC LIMIT ?
-        """, (min(limit, 500),))
+    def api_events(self, limit=50, before=None, since=None):
+        """Events newest first; `before`/`since` are event id cursors
+
+        With `since`, the page is the events just after that id, oldest
+        first, so the last one is the next `since`.
+        """
+        order = 'ASC' if since is not None else 'DESC'
+        return query_db(SQL_EVENTS.format(order=order), (before, since, min(limit, 500)))
 
+    @ttl_cache(tables=('worktrees', 'threads'))
     def api_worktrees(self):
-        return query_db("""
-            SELECT w.id, w.thread_id, w.path, w.branch, w.base_branch, w.status,
-                   t.name as thread_name, t.status as thread_status
-            FROM worktrees w
-            LEFT JOIN threads t ON w.thread_id = t.id
-            ORDER BY w.created_at DESC
-        """)
+        return query_db(SQL_WORKTREES)
 
     def api_logs(self, lines=100):
         log_file = DATA_DIR / 'logs' / 'orchestrator.log'
@@ -775,7 +1187,10 @@ def main():
     print(f"   Press Ctrl+C to stop")
 
     # Security: bind to localhost only to prevent network access
-    server = http.server.HTTPServer(('127.0.0.1', PORT), DebugHandler)
+    # Threaded so the dashboard's parallel API fetches don't queue behind
+    # each other (or behind a slow query / log read)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', PORT), DebugHandler)
+    server.daemon_threads = True
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,10 @@
+-- Migration 008: Dashboard Query Indexes (v1.10.0)
+-- Covers the ORDER BY used by the debug dashboard's worktree listing so it
+-- is served by an index scan instead of a full scan + sort
+-- (threads.status, threads.updated_at, events.processed and events.timestamp
+-- are already indexed by 001_initial)
+
+CREATE INDEX IF NOT EXISTS idx_worktrees_created ON worktrees(created_at);
+
+-- Refresh planner statistics so the new index is picked up
+ANALYZE;
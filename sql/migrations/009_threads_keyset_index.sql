@@ -0,0 +1,13 @@
+-- Migration 009: Thread Keyset Pagination Index (v1.10.0)
+-- The debug dashboard pages threads by (updated_at, id): updated_at has
+-- one-second resolution, so id breaks ties. This index serves both the
+-- ORDER BY and the row-value cursor bounds as a single range scan
+
+CREATE INDEX IF NOT EXISTS idx_threads_updated_id ON threads(updated_at, id);
+
+-- idx_threads_updated(updated_at) is a prefix of the new index, so it only
+-- costs writes now
+DROP INDEX IF EXISTS idx_threads_updated;
+
+-- Refresh planner statistics so the new index is picked up
+ANALYZE;
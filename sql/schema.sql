@@ -136,7 +136,7 @@ CREATE TABLE IF NOT EXISTS worktrees (
 -- Thread lookups
 CREATE INDEX IF NOT EXISTS idx_threads_status ON threads(status);
 CREATE INDEX IF NOT EXISTS idx_threads_mode ON threads(mode);
-CREATE INDEX IF NOT EXISTS idx_threads_updated ON threads(updated_at);
+CREATE INDEX IF NOT EXISTS idx_threads_updated_id ON threads(updated_at, id);
 
 -- Event queries
 CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);
@@ -163,6 +163,7 @@ CREATE INDEX IF NOT EXISTS idx_webhooks_source ON webhooks(source, event_type);
 -- Worktree lookups
 CREATE INDEX IF NOT EXISTS idx_worktrees_thread ON worktrees(thread_id);
 CREATE INDEX IF NOT EXISTS idx_worktrees_status ON worktrees(status);
+CREATE INDEX IF NOT EXISTS idx_worktrees_created ON worktrees(created_at);
 
 -- ============================================================
 -- TRIGGERS
@@ -320,6 +320,33 @@ test_database_initialization() {
         log_fail "No migrations applied"
     fi
 
+    # Check dashboard queries are index-backed
+    log_test "Checking dashboard query plans..."
+    local plan
+    plan=$(sqlite3 .claude-threads/threads.db "EXPLAIN QUERY PLAN SELECT id FROM worktrees ORDER BY created_at DESC" 2>/dev/null)
+    (( ++TESTS_RUN )) || true
+    if echo "$plan" | grep -q "idx_worktrees_created"; then
+        log_pass "worktrees listing uses idx_worktrees_created"
+    else
+        log_fail "worktrees listing does not use an index: $plan"
+    fi
+
+    plan=$(sqlite3 .claude-threads/threads.db "EXPLAIN QUERY PLAN SELECT id FROM threads ORDER BY updated_at DESC, id DESC LIMIT 100" 2>/dev/null)
+    (( ++TESTS_RUN )) || true
+    if echo "$plan" | grep -q "idx_threads_updated_id" && ! echo "$plan" | grep -q "TEMP B-TREE"; then
+        log_pass "threads listing uses idx_threads_updated_id"
+    else
+        log_fail "threads listing does not use an index: $plan"
+    fi
+
+    plan=$(sqlite3 .claude-threads/threads.db "EXPLAIN QUERY PLAN SELECT id FROM threads WHERE (updated_at, id) < ('2026-01-01 00:00:00', 'thread-1-00000000') ORDER BY updated_at DESC, id DESC LIMIT 100" 2>/dev/null)
+    (( ++TESTS_RUN )) || true
+    if echo "$plan" | grep -q "SEARCH.*idx_threads_updated_id" && ! echo "$plan" | grep -q "TEMP B-TREE"; then
+        log_pass "threads keyset page is an index range scan"
+    else
+        log_fail "threads keyset page is not an index range scan: $plan"
+    fi
+
     cd "$TEST_DIR"
 }
 